@@ -1,9 +1,13 @@
+import atexit
 import functools
+import hashlib
 import os
 import re
+import shutil
+import socket
+import threading
 import time
-import zipfile
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import json
 import logging
 import argparse
@@ -13,8 +17,12 @@ from typing import List, Dict, Optional, Set, Tuple, Type, Union
 from urllib.parse import urljoin, unquote, urlparse, parse_qs, urlencode
 
 import requests
-from bs4 import BeautifulSoup
-from tqdm import tqdm
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+
+# zipfile, datetime and tqdm are imported where they're used: none of them
+# is needed to show --help or the interactive menu, and together they're a
+# noticeable chunk of interpreter startup
 
 # Set up logging
 logging.basicConfig(
@@ -27,243 +35,831 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml parser when available; it parses the large set and
+# card pages several times faster than the pure-Python 'html.parser'.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    logger.warning(
+        "lxml not installed; falling back to the much slower html.parser")
+
+# Optional selectolax fast path for the simple selector work on card-list
+# pages; considerably faster again than BeautifulSoup + lxml. Prefer the
+# Lexbor engine (newer, faster, better spec conformance), fall back to the
+# Modest engine on older selectolax builds — both expose the same
+# css/css_first/attributes/text API the scan helpers use.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _FastHTMLParser
+    except ImportError:
+        _FastHTMLParser = None
+
+# Substrings that mark an <a href> as a card link when a list page has no
+# recognizable card containers
+CARD_HREF_PATTERNS = ('/card/', '/set/', '-card-', '-pkmn-')
+
+# orjson handles the growing progress/etag structures far faster than the
+# stdlib json module; fall back to json when it is not installed.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dump(obj, path):
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj))
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dump(obj, path):
+        with open(path, 'w') as f:
+            json.dump(obj, f)
+
+# ISA-L's SIMD deflate is a drop-in for zlib at 2-3x the speed; it only
+# matters when --compress forces DEFLATE archives, so absence is fine
+try:
+    from isal import isal_zlib as _isal_zlib
+except ImportError:
+    _isal_zlib = None
+
+# Regex patterns hit once per card; compile them a single time at import
+# instead of re-running pattern compilation/cache lookups in the hot loops.
+# The original five patterns are fused into three alternations, grouped so
+# scanning order can't flip which pattern wins: the end-anchored pair share
+# one rightmost match, and the two generic digit patterns overlap anyway.
+_CARD_NUM_PATTERNS = (
+    # "Card-123" / any "-123" at end of string
+    re.compile(r'Card[-_](\d+)$|[-_](\d+)$', re.IGNORECASE),
+    # "#123"
+    re.compile(r'#(\d+)'),
+    # "No. 123", "123", or any 1-3 digit number
+    re.compile(r'(?:No\.?|#)?\s*(\d+)|\b(\d{1,3})\b', re.IGNORECASE),
+)
+_DIGITS_RE = re.compile(r'(\d+)')
+_URL_TRAIL_NUM_RE = re.compile(r'(\d+)(?:-\w+)?$')
+_PAGE_NUM_RE = re.compile(r'(?:#|No\.?\s*)?(\d+)(?:\s*/\s*\d+)?')
+_NUM_LABEL_RE = re.compile(r'(?:Card\s*)?(?:No\.?|Number|#)\s*:', re.IGNORECASE)
+_NAME_BRACKETS_RE = re.compile(r'\s*[\[\{].*?[\]\}]')
+_NAME_TRAIL_NUM_RE = re.compile(r'\s*#\d+.*$')
+_SET_CODE_CLEAN_RE = re.compile(r'(-Expansion)?[^\w-]')
+_SAFE_NAME_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'\s+')
+
+
+# Recognized image suffixes, hoisted so the scan loop doesn't rebuild them
+# per entry; names the scraper writes are already lowercase, so the plain
+# endswith usually hits, and the mixed-case fallback only lowercases the
+# extension (a set probe) rather than the whole filename
+_IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+_IMAGE_EXT_SET = frozenset(_IMAGE_EXTS)
+
+
+def _iter_images(root: str):
+    """Yield image paths under root via scandir.
+
+    DirEntry caches the file-type check from the directory read itself, so
+    this avoids the extra stat per entry that os.walk's listdir path pays.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_images(entry.path)
+            elif (entry.name.endswith(_IMAGE_EXTS)
+                  or os.path.splitext(entry.name)[1].lower() in _IMAGE_EXT_SET):
+                yield entry.path
+
+
+def _zip_write(zipf, path: str, arcname: str):
+    """Copy one file into an open archive in a single pass.
+
+    ZipFile.write moves data through 8 KiB chunks, paying a Python round
+    trip and a small crc32 call per chunk. Mapping the file and handing
+    the whole buffer to writestr runs one crc32 pass and one write over
+    contiguous memory instead, with no intermediate copies.
+    """
+    import mmap
+    import zipfile
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipf.compression
+    zinfo._compresslevel = zipf.compresslevel
+    with open(path, 'rb') as src:
+        if zinfo.file_size:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                zipf.writestr(zinfo, mm)
+        else:
+            zipf.writestr(zinfo, b'')
+
+
+def _safe_filename(name: str) -> str:
+    """Sanitize a card name for use in a filename."""
+    # Common case: a plain name with nothing to strip — skip one sub pass
+    if not _SAFE_NAME_RE.search(name):
+        return _WS_RE.sub('-', name.strip())
+    return _WS_RE.sub('-', _SAFE_NAME_RE.sub('', name).strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _url_tail(url: str) -> Tuple[str, ...]:
+    """Split a URL into path parts, memoized — the same card and set URLs
+    get decomposed several times per scrape."""
+    return tuple(url.rstrip('/').split('/'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_set_code(code: str) -> str:
+    """Normalize a set code for use in paths and progress keys."""
+    return _SET_CODE_CLEAN_RE.sub('', code)
+
+
+def _number_from_url(card_url: str) -> str:
+    """Pull a card number out of the tail of a card URL, if present."""
+    last_part = _url_tail(card_url)[-1]
+    if last_part.isdigit():
+        return last_part
+    match = _URL_TRAIL_NUM_RE.search(last_part)
+    return match.group(1) if match else ""
+
+
+def _absolute_url(base_url: str, href: str) -> str:
+    """
+    Resolve an href against the site root without a full urljoin parse.
+
+    Nearly every link on these sites is either already absolute or
+    root-relative, so a prefix check covers the hot path; anything odd
+    (protocol-relative, page-relative) falls back to urljoin.
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/') and not href.startswith('//'):
+        return base_url.rstrip('/') + href
+    return urljoin(base_url, href)
+
+# Pages bigger than this are not card/set pages worth parsing; skip them
+# before materializing the body in memory
+MAX_HTML_BYTES = 5_000_000
+
+# Statuses worth retrying; a frozenset so urllib3's per-response membership
+# check is a hash lookup instead of a list scan
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Sent with image GETs: PNG/JPG are already entropy-coded, so asking for
+# identity keeps a misconfigured server from gzip-wrapping the body and
+# skips the decode machinery on every chunk
+_IMAGE_HEADERS = {'Accept-Encoding': 'identity'}
+
+# Headers every session starts from; hoisted so the scrapers share one copy
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# Fuller browser fingerprint used against pokellector.com
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'DNT': '1',
+    'Sec-GPC': '1',
+}
+
+# CSS selectors on the per-page hot path, parsed once with soupsieve rather
+# than re-parsed on every soup.select() call
+_SEL_SET_LINKS = sv.compile('a.button[name]')
+_SEL_CARD_CONTAINERS = sv.compile('.card-container, .card-item, .card-wrapper, .grid-item')
+_SEL_NEXT_PAGE = sv.compile('a.next, .pagination .next, .next-page, a[rel="next"], .pagination-next a')
+_SEL_CARD_NUMBER = sv.compile(
+    '.card-number, .number, .card-num, .card-info, .card-details, '
+    '[data-number], [data-card-number], [data-num]'
+)
+# One tree walk for the card name / card image instead of one per selector
+# (the bare h1 also covers every h1.<class> variant the old list carried)
+_SEL_CARD_NAME = sv.compile('h1, .card-title, .card-name, .title')
+_SEL_CARD_IMG = sv.compile(
+    'div.card-image img, .card-image img, .product-image img, .card-img img, '
+    'img.card-image, img.product-image, img.wp-post-image, img.attachment-full, '
+    'img.size-full'
+)
+# Loose src-substring matches are a second pass run only when the class-based
+# selector above finds nothing; on well-formed pages they never execute
+_SEL_CARD_IMG_FALLBACK = sv.compile(
+    'img[src*="cards"], img[src*="card"], img[src*="image"], img[src*="images"]'
+)
+
+class _KeepAliveAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that turns on TCP keepalive for pooled connections.
+
+    The scrapers go quiet between sets (discovery, zip top-up, the polite
+    sleep), and NATs drop idle sockets; keepalive probes hold the pooled
+    connections open so the next burst reuses them instead of paying a
+    fresh TCP+TLS handshake.
+    """
+
+    # urllib3's default is just TCP_NODELAY; extend it rather than replace it
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if hasattr(socket, 'TCP_KEEPIDLE'):  # Linux: start probing after 60s idle
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
 class BaseScraper:
     """Base class for all scrapers with common functionality."""
     
     def __init__(self, base_url: str):
         self.base_url = base_url
+        self._base_prefix = base_url.rstrip('/')
         self.session = self._create_session()
         self.downloaded_files = set()
+        # Directories already created this run; saves a makedirs (which
+        # stats every parent) per card once the set directory exists
+        self._known_dirs: Set[str] = set()
+        # Filenames per directory, loaded with one scandir on first use so
+        # skip checks are set lookups instead of a stat per card
+        self._dir_files: Dict[str, Set[str]] = {}
+        # Serializes progress mutation when downloads run on worker threads.
+        # Reentrant because marking a download may trigger a snapshot save.
+        self._progress_lock = threading.RLock()
         self.progress_file = 'progress.json'
         self._load_progress()
         
     def _create_session(self):
-        """Create and configure a requests session."""
+        """Create and configure a requests session.
+
+        Every scraper talks to a single host over hundreds of requests, so
+        the session gets a pooled adapter with urllib3 retries mounted once
+        here — TCP/TLS handshakes are amortized across page and image GETs
+        and backoff (with jitter, honouring Retry-After) happens below the
+        requests layer instead of in per-call loops.
+        """
         session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
+        session.headers.update(DEFAULT_HEADERS)
+        retry_strategy = requests.adapters.Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.3,
+            backoff_max=60,
+            status_forcelist=_RETRYABLE_STATUS,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+        )
+        # Few pools (one host plus its image CDN), but enough connections per
+        # pool to cover the concurrent fetch and download workers; otherwise
+        # urllib3 discards connections and pays a fresh TCP+TLS handshake per
+        # request. The keepalive adapter stops NATs from reaping the pool
+        # while the scraper is busy parsing between request bursts.
+        adapter = _KeepAliveAdapter(
+            max_retries=retry_strategy,
+            pool_connections=4,   # Number of connection pools to cache
+            pool_maxsize=64,      # Max number of connections per pool
+            pool_block=True       # Wait for a pooled socket rather than
+                                  # opening throwaway connections past it
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
         return session
         
     def _load_progress(self):
         """Load progress from file."""
         if os.path.exists(self.progress_file):
             try:
-                with open(self.progress_file, 'r') as f:
-                    self.downloaded_files = set(json.load(f))
+                with open(self.progress_file, 'rb') as f:
+                    self.downloaded_files = set(_json_loads(f.read()))
             except Exception as e:
                 logger.error(f"Error loading progress: {e}")
     
-    def _save_progress(self):
-        """Save progress to file."""
-        try:
-            with open(self.progress_file, 'w') as f:
-                json.dump(list(self.downloaded_files), f)
-        except Exception as e:
-            logger.error(f"Error saving progress: {e}")
-            
-    def get_soup(self, url: str, **kwargs) -> Optional[BeautifulSoup]:
-        """Get BeautifulSoup object from URL with retry logic."""
+    def get_soup(self, url: str, strainer: Optional[SoupStrainer] = None,
+                 **kwargs) -> Optional[BeautifulSoup]:
+        """Get BeautifulSoup object from URL with retry logic.
+
+        A SoupStrainer restricts the parse to matching elements, so callers
+        that only need one kind of node skip materializing the rest of the
+        DOM. Note that a strained soup has no parents outside the matched
+        subtrees, so don't pass one when extraction climbs the tree.
+        """
         try:
-            response = self.session.get(url, timeout=30, **kwargs)
+            response = self.session.get(url, timeout=30, stream=True, **kwargs)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            length = int(response.headers.get('Content-Length') or 0)
+            if length > MAX_HTML_BYTES:
+                logger.warning(f"Skipping oversize response from {url}")
+                response.close()
+                return None
+            if length:
+                # Size known and acceptable: feed the socket straight into
+                # the parser, skipping the intermediate bytes buffer
+                response.raw.decode_content = True
+                return BeautifulSoup(response.raw, HTML_PARSER, parse_only=strainer)
+            # Unknown size: accumulate chunks into one buffer, capping as we go
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buf += chunk
+                if len(buf) > MAX_HTML_BYTES:
+                    logger.warning(f"Skipping oversize response from {url}")
+                    response.close()
+                    return None
+            # Pass bytes so the parser handles the decode itself
+            return BeautifulSoup(bytes(buf), HTML_PARSER, parse_only=strainer)
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    def _abs(self, href: str) -> str:
+        """Resolve an href against this scraper's site root."""
+        return _absolute_url(self._base_prefix, href)
+
+    def _ensure_dir(self, path: str):
+        """makedirs once per directory per run instead of once per card."""
+        if path not in self._known_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._known_dirs.add(path)
+
+    def _populate_existing(self):
+        """Warm the per-directory filename cache with one walk of output_dir.
+
+        Resumed runs then answer every skip check from memory without paying
+        even the first-touch scandir per set directory.
+        """
+        def walk(path: str):
+            names = set()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        names.add(entry.name)
+                        if entry.is_dir(follow_symlinks=False):
+                            self._known_dirs.add(entry.path)
+                            walk(entry.path)
+            except OSError:
+                pass
+            self._dir_files[path] = names
+
+        if os.path.isdir(self.output_dir):
+            walk(self.output_dir)
+
+    def _existing_files(self, dir_path: str) -> Set[str]:
+        """Names already present in dir_path, scanned once and kept current."""
+        files = self._dir_files.get(dir_path)
+        if files is None:
+            try:
+                with os.scandir(dir_path) as it:
+                    files = {entry.name for entry in it}
+            except OSError:
+                files = set()
+            self._dir_files[dir_path] = files
+        return files
+
+    def _download_id(self, card: Dict[str, str]) -> str:
+        """Key a card is tracked under in the downloaded-files progress set."""
+        return f"{card['set_code']}-{card['number']}"
+
+    def recompress_pngs(self, max_workers: Optional[int] = None) -> int:
+        """Losslessly recompress downloaded PNGs with ect or zopflipng.
+
+        Server-encoded PNGs usually carry a generic DEFLATE stream; a
+        one-time aggressive re-encode of the IDAT data shrinks them a few
+        percent to a quarter without touching the pixels. Purely optional:
+        when neither optimizer binary is installed this logs and does
+        nothing, and it only runs behind the --optimize flag since the
+        CPU cost dwarfs the scrape itself.
+        """
+        import subprocess
+
+        if shutil.which('ect'):
+            cmd = ['ect', '-9', '--strict', '-keep']
+        elif shutil.which('zopflipng'):
+            cmd = ['zopflipng', '-y', '-m']
+        else:
+            logger.warning("--optimize requested but neither 'ect' nor "
+                           "'zopflipng' was found on PATH; skipping")
+            return 0
+
+        pngs = [p for p in _iter_images(self.output_dir) if p.endswith('.png')]
+        if not pngs:
+            return 0
+
+        before = sum(os.path.getsize(p) for p in pngs)
+
+        def optimize(path: str) -> bool:
+            # zopflipng takes input and output paths; ect works in place
+            argv = cmd + ([path, path] if cmd[0] == 'zopflipng' else [path])
+            result = subprocess.run(argv, capture_output=True)
+            if result.returncode != 0:
+                logger.debug(f"PNG optimizer failed for {path}: "
+                             f"{result.stderr.decode(errors='replace').strip()}")
+                return False
+            return True
+
+        # The optimizer is an external process, so threads are enough to
+        # keep every core busy while the interpreter just dispatches
+        workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            done = sum(pool.map(optimize, pngs))
+
+        after = sum(os.path.getsize(p) for p in pngs)
+        logger.info(f"Recompressed {done}/{len(pngs)} PNGs: "
+                    f"{before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+        return done
+
 
 class PokemonCardScraper(BaseScraper):
     """Scraper for Pokellector website."""
     
-    def __init__(self, language: str = 'en'):
+    def __init__(self, language: str = 'en', use_cache: bool = True, cache_max_age: int = 86400):
         self.language = language
         base_url = "https://jp.pokellector.com" if language == 'jp' else "https://www.pokellector.com"
         super().__init__(base_url)
         
-        # Configure session with connection pooling and timeouts
-        session = requests.Session()
-        
-        # Create a custom adapter with retry strategy
-        retry_strategy = requests.adapters.Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"]
-        )
-        
-        # Mount the adapter with retry strategy
-        adapter = requests.adapters.HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=10,  # Number of connection pools to cache
-            pool_maxsize=10,      # Max number of connections per pool
-            pool_block=False
-        )
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        
-        # Set default headers
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-            'DNT': '1',
-            'Sec-GPC': '1',
-        })
-        
-        # Configure session timeouts
-        session.request = functools.partial(session.request, timeout=(10, 30))  # (connect, read) timeouts
-        
-        self.session = session
-        self.downloaded_files = set()
-        
+        # Pooled adapter and urllib3 retries come from BaseScraper; this
+        # scraper only layers full browser headers on top.
+        self.session.headers.update(BROWSER_HEADERS)
+
         # Create necessary directories
         self.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pokemon_cards')
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # On-disk HTML cache so a re-run after a crash replays set and card
+        # pages from disk instead of re-fetching everything over the network
+        self.use_cache = use_cache
+        self.cache_max_age = cache_max_age
+        self.cache_dir = os.path.join(self.output_dir, 'html_cache')
+        if self.use_cache:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        # ETags seen per URL; lets an expired cache entry be revalidated with
+        # a conditional GET (304 carries no body) instead of a full refetch
+        self._etags: Dict[str, str] = {}
+        self._etags_file = os.path.join(self.cache_dir, 'etags.json')
+        if self.use_cache and os.path.exists(self._etags_file):
+            try:
+                with open(self._etags_file, 'rb') as f:
+                    self._etags = _json_loads(f.read())
+            except Exception as e:
+                logger.error(f"Error loading etags: {e}")
+
+        # Process pool for CPU-bound page parsing, created on first use
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
         # Load progress if exists
         self.progress_file = os.path.join(self.output_dir, 'progress.json')
+        self.progress_wal_file = os.path.join(self.output_dir, 'progress.wal')
         self.load_progress()
-    
+
+        # Append-only log for per-card checkpoints; save_progress compacts it
+        # back into the JSON snapshot
+        self._progress_wal = open(self.progress_wal_file, 'a', buffering=1)
+        self._last_save = 0.0
+
+        # Archive handle for incremental appends; opened on first download
+        # so finished images are zipped as they land instead of in a second
+        # full pass over the output tree at the end
+        self._zip = None
+        self._zip_lock = threading.Lock()
+
+        # Flush a final snapshot on interpreter exit even when the caller
+        # (or a crash) never reaches main()'s finally block
+        atexit.register(self.save_progress)
+
+    def _cache_path(self, url: str) -> str:
+        """Return the on-disk cache path for a URL."""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html')
+
+    def _read_cache(self, url: str, allow_stale: bool = False) -> Optional[bytes]:
+        """Return cached HTML bytes for a URL if present and not expired.
+
+        With allow_stale, expired entries are returned too (used after a
+        304 revalidation, where the stale body is known to still be current).
+        """
+        path = self._cache_path(url)
+        try:
+            if os.path.exists(path) and (
+                allow_stale or time.time() - os.path.getmtime(path) < self.cache_max_age
+            ):
+                with open(path, 'rb') as f:
+                    return f.read()
+        except Exception as e:
+            logger.debug(f"Error reading cache for {url}: {e}")
+        return None
+
+    def _write_cache(self, url: str, content: bytes):
+        """Store HTML bytes for a URL in the on-disk cache."""
+        try:
+            with open(self._cache_path(url), 'wb') as f:
+                f.write(content)
+        except Exception as e:
+            logger.debug(f"Error writing cache for {url}: {e}")
+
     def load_progress(self):
         """Load progress from previous run"""
         if os.path.exists(self.progress_file):
             try:
-                with open(self.progress_file, 'r') as f:
-                    progress = json.load(f)
+                with open(self.progress_file, 'rb') as f:
+                    progress = _json_loads(f.read())
                     self.downloaded_files = set(progress.get('downloaded_files', []))
-                logger.info(f"Loaded progress: {len(self.downloaded_files)} files already downloaded")
             except Exception as e:
                 logger.error(f"Error loading progress: {e}")
-    
+
+        # Replay the append-only log on top of the snapshot so checkpoints
+        # written since the last compaction are not lost
+        if os.path.exists(self.progress_wal_file):
+            try:
+                with open(self.progress_wal_file, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            self.downloaded_files.add(line)
+            except Exception as e:
+                logger.error(f"Error replaying progress log: {e}")
+
+        if self.downloaded_files:
+            logger.info(f"Loaded progress: {len(self.downloaded_files)} files already downloaded")
+
+    def _mark_downloaded(self, download_id: str):
+        """Record a completed download with an O(1) append to the progress log"""
+        with self._progress_lock:
+            self.downloaded_files.add(download_id)
+            try:
+                self._progress_wal.write(download_id + '\n')
+            except Exception as e:
+                logger.error(f"Error appending to progress log: {e}")
+            self.maybe_save_progress()
+
+    def maybe_save_progress(self, min_interval: float = 5.0):
+        """Compact progress at most once per min_interval seconds.
+
+        The append-only log already makes every download durable; this just
+        keeps the snapshot from being rewritten on every card.
+        """
+        now = time.monotonic()
+        if now - self._last_save >= min_interval:
+            self.save_progress()
+
     def save_progress(self):
-        """Save current progress to file"""
+        """Compact progress into the JSON snapshot and truncate the log"""
+        with self._progress_lock:
+            try:
+                # Write-then-rename so a crash mid-write can't corrupt the snapshot
+                tmp_file = self.progress_file + '.tmp'
+                _json_dump({'downloaded_files': list(self.downloaded_files)}, tmp_file)
+                os.replace(tmp_file, self.progress_file)
+                self._progress_wal.truncate(0)
+            except Exception as e:
+                logger.error(f"Error saving progress: {e}")
+            if self.use_cache:
+                self._save_etags()
+            self._last_save = time.monotonic()
+
+    def _save_etags(self):
+        """Persist the URL -> ETag map next to the HTML cache"""
         try:
-            with open(self.progress_file, 'w') as f:
-                json.dump({'downloaded_files': list(self.downloaded_files)}, f)
+            _json_dump(self._etags, self._etags_file)
         except Exception as e:
-            logger.error(f"Error saving progress: {e}")
+            logger.error(f"Error saving etags: {e}")
     
-    def get_soup(self, url: str, max_retries: int = 3, initial_delay: float = 1.0) -> Optional[BeautifulSoup]:
+    def get_soup(self, url: str) -> Optional[BeautifulSoup]:
         """
-        Get BeautifulSoup object from URL with retry logic and exponential backoff.
-        
+        Get BeautifulSoup object from URL.
+
         Args:
             url: The URL to fetch
-            max_retries: Maximum number of retry attempts
-            initial_delay: Initial delay between retries in seconds (will be doubled after each retry)
-            
+
         Returns:
             BeautifulSoup object if successful, None otherwise
         """
-        delay = initial_delay
-        last_exception = None
-        
-        for attempt in range(max_retries + 1):  # +1 because we want to try at least once
-            try:
-                # Increase timeout for the initial request
-                response = self.session.get(
-                    url,
-                    headers=self.session.headers,
-                    timeout=(10, 30)  # (connect timeout, read timeout) in seconds
-                )
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
-                
-            except requests.exceptions.Timeout as e:
-                last_exception = e
-                if attempt < max_retries:
-                    retry_after = min(delay * (2 ** attempt), 60)  # Cap at 60 seconds
-                    logger.warning(
-                        f"Timeout fetching {url} (attempt {attempt + 1}/{max_retries}). "
-                        f"Retrying in {retry_after:.1f} seconds..."
-                    )
-                    time.sleep(retry_after)
-                
-            except requests.exceptions.RequestException as e:
-                last_exception = e
-                if attempt < max_retries and self._is_retryable_error(e):
-                    retry_after = min(delay * (2 ** attempt), 60)
-                    logger.warning(
-                        f"Error fetching {url} (attempt {attempt + 1}/{max_retries}): {e}. "
-                        f"Retrying in {retry_after:.1f} seconds..."
-                    )
-                    time.sleep(retry_after)
-                else:
-                    break
-            
-            except Exception as e:
-                last_exception = e
-                logger.error(f"Unexpected error fetching {url}: {e}")
-                break
-        
-        logger.error(f"Failed to fetch {url} after {max_retries + 1} attempts. Last error: {last_exception}")
+        html = self.get_html(url)
+        if html is None:
+            return None
+        return BeautifulSoup(html, HTML_PARSER)
+
+    def get_html(self, url: str) -> Optional[bytes]:
+        """
+        Fetch raw HTML bytes from URL.
+
+        Split out from get_soup so callers can ship the unparsed bytes to a
+        worker process and parse there. Retries, exponential backoff with
+        jitter and Retry-After handling all live in the urllib3 Retry mounted
+        on the session, so a failure surfacing here is final.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Raw HTML bytes if successful, None otherwise
+        """
+        # Serve from the on-disk cache when possible so repeated runs
+        # skip the network entirely
+        conditional_headers = {}
+        if self.use_cache:
+            cached = self._read_cache(url)
+            if cached is not None:
+                logger.debug(f"Cache hit for {url}")
+                return cached
+            # Expired entry with a known ETag: ask the server to confirm it
+            # is still current so a 304 saves transferring the body
+            etag = self._etags.get(url)
+            if etag and os.path.exists(self._cache_path(url)):
+                conditional_headers['If-None-Match'] = etag
+
+        try:
+            # Stream so we can reject oversize bodies before reading them
+            response = self.session.get(
+                url,
+                headers=conditional_headers or None,
+                stream=True,
+                timeout=(10, 30)  # (connect timeout, read timeout) in seconds
+            )
+            response.raise_for_status()
+            if response.status_code == 304:
+                cached = self._read_cache(url, allow_stale=True)
+                if cached is not None:
+                    logger.debug(f"304 Not Modified for {url}")
+                    os.utime(self._cache_path(url))  # restart freshness window
+                    return cached
+                # Cached body vanished; refetch unconditionally
+                self._etags.pop(url, None)
+                return self.get_html(url)
+            content_length = int(response.headers.get('Content-Length') or 0)
+            if content_length > MAX_HTML_BYTES:
+                logger.warning(f"Skipping oversize response ({content_length} bytes) from {url}")
+                response.close()
+                return None
+            # Read the body in chunks into a single growable buffer;
+            # this avoids requests' chunk-list + join copy and enforces
+            # the size cap even when Content-Length is missing
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buf += chunk
+                if len(buf) > MAX_HTML_BYTES:
+                    logger.warning(f"Skipping oversize response from {url}")
+                    response.close()
+                    return None
+            content = bytes(buf)
+            if self.use_cache:
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._etags[url] = etag
+                self._write_cache(url, content)
+            return content
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error fetching {url}: {e}")
         return None
-    
-    def _is_retryable_error(self, error: Exception) -> bool:
+
+    def _fetch_pages(self, urls: List[str], max_workers: int = 20) -> Dict[str, Optional[bytes]]:
         """
-        Determine if an error is retryable.
-        
+        Fetch multiple pages concurrently and return a mapping of URL to raw HTML.
+
+        Card detail pages are independent of each other, so fetching them one at a
+        time leaves the scraper waiting on network round-trips. The worker count
+        bounds how many requests are in flight at once, which also acts as the
+        rate limiter towards the server.
+
         Args:
-            error: The exception to check
-            
+            urls: The URLs to fetch
+            max_workers: Maximum number of concurrent requests
+
         Returns:
-            bool: True if the error is retryable, False otherwise
+            Dict mapping each URL to its raw HTML bytes (None on failure)
         """
-        if isinstance(error, (requests.exceptions.Timeout,
-                            requests.exceptions.ConnectionError,
-                            requests.exceptions.ChunkedEncodingError,
-                            requests.exceptions.RetryError)):
-            return True
-            
-        # Check for HTTP status codes that can be retried
-        if isinstance(error, requests.exceptions.HTTPError):
-            status_code = error.response.status_code
-            return status_code in [429, 500, 502, 503, 504, 522, 524]
-            
-        return False
+        pages: Dict[str, Optional[bytes]] = {}
+        if not urls:
+            return pages
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            future_to_url = {executor.submit(self.get_html, url): url for url in urls}
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    pages[url] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {url}: {e}")
+                    pages[url] = None
+
+        return pages
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily create the shared process pool used for page parsing."""
+        if self._parse_pool is None and (os.cpu_count() or 1) > 1:
+            try:
+                self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Process pool unavailable, parsing in-process: {e}")
+        return self._parse_pool
+
+    def _extract_cards_from_pages(self, pages: Dict[str, Optional[bytes]],
+                                  set_info: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        Parse fetched card pages and extract their card details.
+
+        Parsing plus regex extraction is CPU-bound, so batches big enough to
+        amortize process startup are farmed out to a process pool; small
+        batches are handled inline.
+
+        Args:
+            pages: Mapping of card URL to raw HTML (as returned by _fetch_pages)
+            set_info: The set the cards belong to
+
+        Returns:
+            List of extracted card dicts
+        """
+        items = [(url, raw) for url, raw in pages.items() if raw]
+        cards = []
+
+        pool = self._get_parse_pool() if len(items) >= 8 else None
+        if pool is not None:
+            future_to_url = {
+                pool.submit(_parse_card_page, raw, url, set_info, self.base_url): url
+                for url, raw in items
+            }
+            for future in as_completed(future_to_url):
+                try:
+                    card = future.result()
+                except Exception as e:
+                    logger.error(f"Error parsing {future_to_url[future]}: {e}")
+                    continue
+                if card:
+                    cards.append(card)
+                    logger.info(f"Found card: {card['name']} ({card['number']})")
+        else:
+            for url, raw in items:
+                card = _parse_card_page(raw, url, set_info, self.base_url)
+                if card:
+                    cards.append(card)
+                    logger.info(f"Found card: {card['name']} ({card['number']})")
+
+        return cards
 
     def get_sets(self) -> List[Dict[str, str]]:
         """Get all Pokémon card sets from the main page."""
         logger.info("Fetching list of all Pokémon sets...")
-        soup = self.get_soup(f"{self.base_url}/sets")
-        if not soup:
+        html = self.get_html(f"{self.base_url}/sets")
+        if not html:
             return []
-        
+
+        # Find all set links in the grid - they're in <a> tags with class
+        # 'button' and have a name attribute. The attribute and span reads
+        # happen in C when selectolax is available; the soup branch mirrors it.
+        if _FastHTMLParser is not None:
+            tree = _FastHTMLParser(html)
+            set_links = []
+            for node in tree.css('a.button[name]'):
+                span = node.css_first('span')
+                set_links.append((
+                    node.attributes.get('href') or '',
+                    node.attributes.get('title') or '',
+                    span.text(strip=True) if span is not None else '',
+                ))
+        else:
+            soup = BeautifulSoup(html, HTML_PARSER)
+            set_links = []
+            for link in _SEL_SET_LINKS.select(soup):
+                span = link.find('span')
+                set_links.append((
+                    link.get('href') or '',
+                    link.get('title') or '',
+                    span.get_text(strip=True) if span else '',
+                ))
+
         sets = []
-        # Find all set links in the grid - they're in <a> tags with class 'button' and have a name attribute
-        set_links = soup.select('a.button[name]')
-        
-        for link in set_links:
+        for href, title, span_text in set_links:
             try:
+                if not href:
+                    continue
                 # Get the set URL from the href attribute
-                set_url = urljoin(self.base_url, link['href'])
-                
+                set_url = self._abs(href)
+
                 # Get the set name from the title attribute or the span text
-                set_name = link.get('title', '').replace(' Set', '').strip()
-                if not set_name:
-                    set_name = link.find('span')
-                    set_name = set_name.get_text(strip=True) if set_name else ''
-                
+                set_name = title.replace(' Set', '').strip() or span_text
+
                 # Get the set code from the URL (e.g., 'Destined-Rivals-Expansion')
-                set_code = set_url.rstrip('/').split('/')[-1]
-                
+                set_code = _url_tail(set_url)[-1]
+
                 # Skip if we don't have a valid set code or name
                 if not set_code or not set_name:
                     continue
-                
+
                 # Clean up set code for directory name (remove 'Expansion' and special chars)
-                clean_set_code = re.sub(r'(-Expansion)?[^\w-]', '', set_code)
+                clean_set_code = _clean_set_code(set_code)
                 
                 sets.append({
                     'name': set_name.strip(),
@@ -285,142 +881,206 @@ class PokemonCardScraper(BaseScraper):
         logger.info(f"Processing set: {set_info['name']} ({set_info['code']})")
         
         # Try multiple URL patterns to find the card list
+        set_url = set_info['url'].rstrip('/')
         base_urls = [
-            set_info['url'].rstrip('/') + '/cards',  # Try /cards suffix first
-            set_info['url'].rstrip('/') + '/all',    # Try /all suffix
-            set_info['url'].rstrip('/')              # Try the original URL
+            set_url + '/cards',  # Try /cards suffix first
+            set_url + '/all',    # Try /all suffix
+            set_url              # Try the original URL
         ]
         
-        soup = None
+        html = None
         card_list_url = ""
-        
+
         # Try each URL pattern until we find one that works
         for url in base_urls:
             logger.debug(f"Trying URL: {url}")
-            soup = self.get_soup(url)
-            if soup:
+            html = self.get_html(url)
+            if html:
                 card_list_url = url
                 logger.info(f"Found valid URL: {url}")
                 break
-        
-        if not soup:
+
+        if not html:
             logger.warning(f"Failed to fetch set page: {set_info['name']}")
             return []
-        
-        # Check if this is a card detail page
-        card = self._extract_card_details_from_page(soup, card_list_url, set_info)
+
+        # Check if this is a card detail page (needs the full bs4 tree)
+        card = self._extract_card_details_from_page(
+            BeautifulSoup(html, HTML_PARSER), card_list_url, set_info)
         if card:
             logger.info(f"Found single card: {card['name']} ({card['number']})")
             return [card]
-        
+
         cards = []
+        seen_urls: Set[str] = set()  # O(1) dedup instead of scanning the cards list
         page = 1
         has_more = True
-        
+
         while has_more and page <= 20:  # Safety limit of 20 pages
-            # For the first page, use the URL we already have
+            # For the first page, use the HTML we already have
             if page > 1:
                 url = f"{card_list_url}?page={page}"  # Some sites use ?page=
                 logger.debug(f"Fetching page {page} from {url}")
-                soup = self.get_soup(url)
-                if not soup:
+                html = self.get_html(url)
+                if not html:
                     # Try with /page/ format if ?page= didn't work
                     url = f"{card_list_url}/page/{page}"
                     logger.debug(f"Trying alternative pagination: {url}")
-                    soup = self.get_soup(url)
-                    if not soup:
+                    html = self.get_html(url)
+                    if not html:
                         logger.warning(f"Failed to fetch page {page} for set {set_info['name']}")
                         break
-            
-            # Try to find card containers - these might contain the actual card links
-            card_containers = soup.select('.card-container, .card-item, .card-wrapper, .grid-item')
-            logger.debug(f"Found {len(card_containers)} potential card containers")
-            
-            # If no containers found, try to find any links that might be cards
-            if not card_containers:
-                all_links = soup.find_all('a', href=True)
-                card_links = []
-                
-                # Look for links that contain common card URL patterns
-                for link in all_links:
-                    href = link.get('href', '').lower()
-                    if any(pattern in href for pattern in ['/card/', '/set/', '-card-', '-pkmn-']):
-                        card_links.append(link)
-                
-                logger.debug(f"Found {len(card_links)} potential card links")
-                
-                # Process the card links we found
-                for card_link in card_links:
-                    try:
-                        card_url = urljoin(self.base_url, card_link['href'])
-                        
-                        # Skip if we've already processed this card
-                        if any(c['card_url'] == card_url for c in cards):
-                            continue
-                        
-                        # Try to get card details from the card's page
-                        card_soup = self.get_soup(card_url)
-                        if not card_soup:
-                            continue
-                        
-                        # Extract card details from the card page
-                        card = self._extract_card_details_from_page(card_soup, card_url, set_info)
-                        if card:
-                            cards.append(card)
-                            logger.info(f"Found card: {card['name']} ({card['number']})")
-                        
-                        # Be nice to the server
-                        time.sleep(0.5)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing card: {e}")
-                        continue
-            else:
-                # Process card containers
-                for container in card_containers:
-                    try:
-                        # Find the first link in the container
-                        link = container.find('a', href=True)
-                        if not link:
-                            continue
-                            
-                        card_url = urljoin(self.base_url, link['href'])
-                        
-                        # Skip if we've already processed this card
-                        if any(c['card_url'] == card_url for c in cards):
-                            continue
-                        
-                        # Try to get card details from the container first
-                        card = self._extract_card_from_container(container, card_url, set_info)
-                        if not card:
-                            # If that fails, fetch the card page
-                            card_soup = self.get_soup(card_url)
-                            if not card_soup:
-                                continue
-                            card = self._extract_card_details_from_page(card_soup, card_url, set_info)
-                        
-                        if card:
-                            cards.append(card)
-                            logger.info(f"Found card: {card['name']} ({card['number']})")
-                        
-                        # Be nice to the server
-                        time.sleep(0.5)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing card container: {e}")
-                        continue
-            
-            # Check if there's a next page
-            next_page = soup.select_one('a.next, .pagination .next, .next-page, a[rel="next"], .pagination-next a')
-            if not next_page:
-                has_more = False
+
+            # Scan the list page for cards; list pages only need a handful of
+            # simple selectors, which selectolax handles much faster than a
+            # full BeautifulSoup tree
+            if _FastHTMLParser is not None:
+                found, pending_urls, has_more = self._scan_card_list_fast(html, set_info, seen_urls)
             else:
+                found, pending_urls, has_more = self._scan_card_list_soup(
+                    BeautifulSoup(html, HTML_PARSER), set_info, seen_urls)
+            cards.extend(found)
+
+            # Fetch outstanding detail pages concurrently, then parse and
+            # extract (in a process pool for large batches)
+            pages = self._fetch_pages(pending_urls)
+            cards.extend(self._extract_cards_from_pages(pages, set_info))
+
+            if has_more:
                 page += 1
-                # Be nice to the server
-                time.sleep(1)
-        
+
         logger.info(f"Found {len(cards)} cards in set {set_info['name']}")
         return cards
+
+    def _scan_card_list_soup(self, soup, set_info: Dict[str, str],
+                             seen_urls: Set[str]) -> Tuple[List[Dict[str, str]], List[str], bool]:
+        """
+        Scan one card-list page with BeautifulSoup.
+
+        Returns a tuple of (cards extracted locally, card URLs that still need
+        their detail page fetched, whether a next-page link is present).
+        """
+        cards = []
+        pending_urls = []
+
+        card_containers = _SEL_CARD_CONTAINERS.select(soup)
+        logger.debug(f"Found {len(card_containers)} potential card containers")
+
+        if not card_containers:
+            # No containers: fall back to links matching card URL patterns
+            for link in soup.find_all('a', href=True):
+                href = link.get('href', '')
+                if not any(pattern in href.lower() for pattern in CARD_HREF_PATTERNS):
+                    continue
+                card_url = self._abs(href)
+                if card_url in seen_urls:
+                    continue
+                seen_urls.add(card_url)
+                # The link's parent often carries the name/number/image
+                # already; only fetch the detail page when it doesn't
+                card = None
+                if link.parent is not None:
+                    card = self._extract_card_from_container(link.parent, card_url, set_info)
+                if card and card['img_url']:
+                    cards.append(card)
+                    logger.info(f"Found card: {card['name']} ({card['number']})")
+                else:
+                    pending_urls.append(card_url)
+            logger.debug(f"Found {len(pending_urls)} potential card links")
+        else:
+            # Extract what we can locally; queue the rest for a page fetch
+            for container in card_containers:
+                try:
+                    link = container.find('a', href=True)
+                    if not link:
+                        continue
+
+                    card_url = self._abs(link['href'])
+                    if card_url in seen_urls:
+                        continue
+                    seen_urls.add(card_url)
+
+                    # Only accept a locally extracted card when it carries an
+                    # image URL; otherwise the detail page has to supply it
+                    card = self._extract_card_from_container(container, card_url, set_info)
+                    if card and card['img_url']:
+                        cards.append(card)
+                        logger.info(f"Found card: {card['name']} ({card['number']})")
+                    else:
+                        pending_urls.append(card_url)
+
+                except Exception as e:
+                    logger.error(f"Error processing card container: {e}")
+                    continue
+
+        has_next = _SEL_NEXT_PAGE.select_one(soup) is not None
+        return cards, pending_urls, has_next
+
+    def _scan_card_list_fast(self, html: bytes, set_info: Dict[str, str],
+                             seen_urls: Set[str]) -> Tuple[List[Dict[str, str]], List[str], bool]:
+        """
+        Scan one card-list page with selectolax.
+
+        Mirrors _scan_card_list_soup but works on the selectolax tree, which
+        parses and selects several times faster for this simple structure.
+        """
+        tree = _FastHTMLParser(html)
+        cards = []
+        pending_urls = []
+
+        card_containers = tree.css('.card-container, .card-item, .card-wrapper, .grid-item')
+        logger.debug(f"Found {len(card_containers)} potential card containers")
+
+        if not card_containers:
+            # No containers: fall back to links matching card URL patterns
+            for link in tree.css('a[href]'):
+                href = link.attributes.get('href') or ''
+                if not any(pattern in href.lower() for pattern in CARD_HREF_PATTERNS):
+                    continue
+                card_url = self._abs(href)
+                if card_url in seen_urls:
+                    continue
+                seen_urls.add(card_url)
+                # The link's parent often carries the name/number/image
+                # already; only fetch the detail page when it doesn't
+                card = None
+                if link.parent is not None:
+                    card = self._extract_card_from_node(link.parent, card_url, set_info)
+                if card and card['img_url']:
+                    cards.append(card)
+                    logger.info(f"Found card: {card['name']} ({card['number']})")
+                else:
+                    pending_urls.append(card_url)
+            logger.debug(f"Found {len(pending_urls)} potential card links")
+        else:
+            # Extract what we can locally; queue the rest for a page fetch
+            for container in card_containers:
+                try:
+                    link = container.css_first('a[href]')
+                    if not link:
+                        continue
+
+                    card_url = self._abs(link.attributes.get('href') or '')
+                    if card_url in seen_urls:
+                        continue
+                    seen_urls.add(card_url)
+
+                    # Only accept a locally extracted card when it carries an
+                    # image URL; otherwise the detail page has to supply it
+                    card = self._extract_card_from_node(container, card_url, set_info)
+                    if card and card['img_url']:
+                        cards.append(card)
+                        logger.info(f"Found card: {card['name']} ({card['number']})")
+                    else:
+                        pending_urls.append(card_url)
+
+                except Exception as e:
+                    logger.error(f"Error processing card container: {e}")
+                    continue
+
+        has_next = tree.css_first(
+            'a.next, .pagination .next, .next-page, a[rel="next"], .pagination-next a') is not None
+        return cards, pending_urls, has_next
     
     def _extract_card_from_container(self, container, card_url: str, set_info: Dict[str, str]) -> Optional[Dict[str, str]]:
         """Extract card details from a container element."""
@@ -434,40 +1094,32 @@ class PokemonCardScraper(BaseScraper):
             card_number = ""
             if number_elem:
                 # Extract first sequence of digits
-                match = re.search(r'(\d+)', number_elem.get_text(strip=True))
+                match = _DIGITS_RE.search(number_elem.get_text(strip=True))
                 if match:
                     card_number = match.group(1)
             
             # If we couldn't find a number, try to extract from URL
             if not card_number:
-                url_parts = card_url.rstrip('/').split('/')
-                if len(url_parts) >= 2 and url_parts[-1].isdigit():
-                    card_number = url_parts[-1]
-                else:
-                    # Try to find number in the last part of the URL
-                    last_part = url_parts[-1]
-                    match = re.search(r'(\d+)(?:-\w+)?$', last_part)
-                    if match:
-                        card_number = match.group(1)
-            
+                card_number = _number_from_url(card_url)
+
             # Try to find the image
             img = container.find('img')
             img_url = ""
             if img:
                 img_url = img.get('data-src') or img.get('src', '')
                 if img_url and not img_url.startswith('http'):
-                    img_url = urljoin(self.base_url, img_url)
-            
+                    img_url = self._abs(img_url)
+
             if not card_name:
                 if img and img.get('alt'):
                     card_name = img['alt'].strip()
                 else:
                     card_name = f"Card-{card_number}" if card_number else "Unknown"
-            
+
             if not card_number:
                 logger.warning(f"Couldn't determine card number for: {card_name}")
                 return None
-            
+
             return {
                 'name': card_name,
                 'number': card_number.zfill(3),
@@ -476,236 +1128,91 @@ class PokemonCardScraper(BaseScraper):
                 'set_code': set_info['code'],
                 'set_name': set_info['name']
             }
-            
+
         except Exception as e:
             logger.error(f"Error extracting card from container: {e}")
             return None
-    
-    def _extract_card_number(self, card_link, card_url: str) -> Optional[str]:
-        """Extract and clean the card number from various possible locations."""
-        # Try to get from card number element first
-        card_number_elem = card_link.select_one('.card-number')
-        if card_number_elem:
-            number_text = card_number_elem.get_text(strip=True)
-            # Extract first sequence of digits (e.g., '1/102' -> '1')
-            match = re.search(r'(\d+)', number_text.split('/')[0])
-            if match:
-                return match.group(1)
-        
-        # If not found, try to extract from URL (e.g., '/card/set/SWSH12/1' -> '1')
-        url_parts = card_url.rstrip('/').split('/')
-        if len(url_parts) >= 2 and url_parts[-1].isdigit():
-            return url_parts[-1]
-        
-        # Try to find number in the last part of the URL
-        last_part = url_parts[-1]
-        match = re.search(r'(\d+)(?:-\w+)?$', last_part)
-        if match:
-            return match.group(1)
-        
-        logger.warning(f"Couldn't determine card number for: {card_url}")
-        return None
-    
-    def _extract_card_details_from_page(self, soup, card_url: str, set_info: Dict[str, str]) -> Optional[Dict[str, str]]:
-        """Extract card details from a card detail page."""
+
+    def _extract_card_from_node(self, node, card_url: str, set_info: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """selectolax counterpart of _extract_card_from_container."""
         try:
-            logger.debug(f"Extracting card details from: {card_url}")
-            
-            # First, try to extract card number from the URL
-            # Example: https://www.pokellector.com/Journey-Together-Expansion/Meowscarada-ex-Card-18
-            card_number = None
-            url_parts = card_url.rstrip('/').split('/')
-            
-            # Debug: Log URL parts for analysis
-            logger.debug(f"URL parts: {url_parts}")
-            
-            # Try to extract number from the last part of the URL (e.g., "Meowscarada-ex-Card-18" -> "18")
-            last_part = url_parts[-1]
-            logger.debug(f"Last part of URL: {last_part}")
-            
-            # Try different patterns to extract the card number
-            patterns = [
-                r'Card[-_](\d+)$',           # Matches "Card-123" at end of string
-                r'[-_](\d+)$',                # Matches any number at end after - or _
-                r'#(\d+)',                   # Matches "#123"
-                r'(?:No\.?|#)?\s*(\d+)',    # Matches "No. 123" or "#123" or "123"
-                r'\b(\d{1,3})\b'            # Matches any 1-3 digit number
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, last_part, re.IGNORECASE)
+            # Try to find the card name
+            name_elem = node.css_first('.card-name, .name, .title, h3, h4')
+            card_name = name_elem.text(strip=True) if name_elem else ""
+
+            # Try to find the card number
+            number_elem = node.css_first('.card-number, .number, .num')
+            card_number = ""
+            if number_elem:
+                # Extract first sequence of digits
+                match = _DIGITS_RE.search(number_elem.text(strip=True))
                 if match:
                     card_number = match.group(1)
-                    logger.debug(f"Extracted card number '{card_number}' using pattern: {pattern}")
-                    break
-            
-            # If not found in URL, try to find it in the page content
-            if not card_number:
-                logger.debug("Card number not found in URL, checking page content")
-                # Look for common number patterns in the page
-                number_selectors = [
-                    '.card-number',
-                    '.number',
-                    '.card-info',
-                    '.card-details',
-                    'p:contains("Card Number")',
-                    'th:contains("Number") + td',
-                    '.card-num',
-                    '.card-number',
-                    '.number',
-                    '.card-info-number',
-                    '.card-details-number',
-                    '.card-data-number',
-                    '.card-meta-number',
-                    '.card-header-number',
-                    '.card-footer-number',
-                    'span:contains("No.")',
-                    'span:contains("#")',
-                    'div:contains("Card Number:")',
-                    'div:contains("Card No:")',
-                    'div:contains("Number:")',
-                    'div:contains("No.:")',
-                    'div:contains("#:")',
-                    'td:contains("Card Number") + td',
-                    'td:contains("Card No") + td',
-                    'td:contains("Number") + td',
-                    'td:contains("No.") + td',
-                    'td:contains("#") + td',
-                    'li:contains("Card Number")',
-                    'li:contains("Card No")',
-                    'li:contains("Number")',
-                    'li:contains("No.")',
-                    'li:contains("#")'
-                ]
-                
-                for selector in number_selectors:
-                    try:
-                        number_elems = soup.select(selector)
-                        for elem in number_elems:
-                            text = elem.get_text(strip=True)
-                            # Look for patterns like "#123" or "123/200" or "No. 123"
-                            match = re.search(r'(?:#|No\.?\s*)?(\d+)(?:\s*/\s*\d+)?', text)
-                            if match:
-                                card_number = match.group(1)
-                                logger.debug(f"Found card number '{card_number}' in selector: {selector}")
-                                break
-                            
-                            # Also check for numbers in data attributes
-                            for attr in ['data-number', 'data-card-number', 'data-num']:
-                                if attr in elem.attrs:
-                                    match = re.search(r'(\d+)', elem[attr])
-                                    if match:
-                                        card_number = match.group(1)
-                                        logger.debug(f"Found card number '{card_number}' in {attr} attribute of: {selector}")
-                                        break
-                            
-                            if card_number:
-                                break
-                        
-                        if card_number:
-                            break
-                            
-                    except Exception as e:
-                        logger.debug(f"Error processing selector '{selector}': {e}")
-                        continue
-            
+
+            # If we couldn't find a number, try to extract from URL
             if not card_number:
-                logger.warning(f"Couldn't determine card number for: {card_url}")
-                logger.debug(f"Page title: {soup.title.string if soup.title else 'No title'}")
-                
-                # Dump the first 1000 characters of the page for debugging
-                page_text = str(soup)[:1000]
-                logger.debug(f"Page content (first 1000 chars):\n{page_text}")
-                
-                return None
-            
-            # Clean up the card number (remove leading zeros, etc.)
-            card_number = str(int(card_number))  # Converts "001" to "1"
-            
-            # Get card name - try multiple selectors
-            card_name = None
-            name_selectors = [
-                'h1.entry-title',
-                'h1',
-                '.card-title',
-                '.card-name',
-                '.title',
-                'h1.card-title',
-                'h1.product-title',
-                'h1.entry-title',
-                'h1.title',
-                'h1.product-name',
-                'h1.product_title'
-            ]
-            
-            for selector in name_selectors:
-                name_elem = soup.select_one(selector)
-                if name_elem:
-                    card_name = name_elem.get_text(strip=True)
-                    # Clean up the name (remove set name, card number, etc.)
-                    card_name = re.sub(r'\s*[\[\{].*?[\]\}]', '', card_name)  # Remove anything in brackets
-                    card_name = re.sub(r'\s*#\d+.*$', '', card_name)  # Remove card number at the end
-                    card_name = card_name.strip()
-                    if card_name:
-                        break
-            
+                card_number = _number_from_url(card_url)
+
+            # Try to find the image
+            img = node.css_first('img')
+            img_url = ""
+            if img:
+                img_url = img.attributes.get('data-src') or img.attributes.get('src') or ''
+                if img_url and not img_url.startswith('http'):
+                    img_url = self._abs(img_url)
+
             if not card_name:
-                # If we still don't have a name, try to extract it from the URL
-                name_part = last_part.split('-Card-')[0]  # Get part before "-Card-123"
-                if name_part:
-                    card_name = name_part.replace('-', ' ').title()
+                alt = img.attributes.get('alt') if img else None
+                if alt and alt.strip():
+                    card_name = alt.strip()
                 else:
-                    card_name = f"Card-{card_number}"
-            
-            # Get image URL - try multiple selectors and attributes
-            img_url = None
-            img_selectors = [
-                'div.card-image img',
-                '.card-image img',
-                '.product-image img',
-                '.card-img img',
-                'img.card-image',
-                'img.product-image',
-                'img.wp-post-image',
-                'img.attachment-full',
-                'img.size-full',
-                'img[src*="cards"]',
-                'img[src*="card"]',
-                'img[src*="image"]',
-                'img[src*="images"]'
-            ]
-            
-            for selector in img_selectors:
-                img = soup.select_one(selector)
-                if img:
-                    img_url = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-                    if img_url and not img_url.startswith(('http://', 'https://')):
-                        img_url = urljoin(self.base_url, img_url)
-                    if img_url and img_url.endswith(('.jpg', '.jpeg', '.png', '.webp')):
-                        break
-            
-            if not img_url:
-                logger.warning(f"No image found on card page: {card_url}")
+                    card_name = f"Card-{card_number}" if card_number else "Unknown"
+
+            if not card_number:
+                logger.warning(f"Couldn't determine card number for: {card_name}")
                 return None
-            
-            # Clean up the image URL (remove query parameters, etc.)
-            img_url = img_url.split('?')[0]
-            
-            # Clean up the card name for filename
-            safe_name = re.sub(r'[^\w\s-]', '', card_name).strip().replace(' ', '-')
-            
+
             return {
                 'name': card_name,
-                'number': card_number.zfill(3),  # Pad with leading zeros
+                'number': card_number.zfill(3),
                 'img_url': img_url,
                 'card_url': card_url,
                 'set_code': set_info['code'],
                 'set_name': set_info['name']
             }
-            
+
         except Exception as e:
-            logger.error(f"Error extracting details from card page {card_url}: {e}")
+            logger.error(f"Error extracting card from node: {e}")
             return None
+    
+    def _extract_card_number(self, card_link, card_url: str) -> Optional[str]:
+        """Extract and clean the card number from various possible locations."""
+        # Try to get from card number element first
+        card_number_elem = card_link.select_one('.card-number')
+        if card_number_elem:
+            number_text = card_number_elem.get_text(strip=True)
+            # Extract first sequence of digits (e.g., '1/102' -> '1')
+            match = _DIGITS_RE.search(number_text.split('/')[0])
+            if match:
+                return match.group(1)
+        
+        # If not found, try to extract from URL (e.g., '/card/set/SWSH12/1' -> '1')
+        url_parts = _url_tail(card_url)
+        if len(url_parts) >= 2 and url_parts[-1].isdigit():
+            return url_parts[-1]
+        
+        # Try to find number in the last part of the URL
+        last_part = url_parts[-1]
+        match = _URL_TRAIL_NUM_RE.search(last_part)
+        if match:
+            return match.group(1)
+
+        logger.warning(f"Couldn't determine card number for: {card_url}")
+        return None
+    
+    def _extract_card_details_from_page(self, soup, card_url: str, set_info: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """Extract card details from a card detail page."""
+        return _extract_card_details(soup, card_url, set_info, self.base_url)
 
     def download_image(self, card: Dict[str, str]) -> bool:
         """Download a single card image."""
@@ -717,102 +1224,337 @@ class PokemonCardScraper(BaseScraper):
                 self.language,   # Language
                 card['set_code']
             )
-            os.makedirs(set_dir, exist_ok=True)
-            
+            self._ensure_dir(set_dir)
+
             # Create filename: [set-code]-[number].png
             filename = f"{card['set_code']}-{card['number']}.png"
             filepath = os.path.join(set_dir, filename)
-            
+
             # Create a unique identifier for this download to track progress
-            download_id = f"{card['set_code']}-{card['number']}"
-            
-            # Skip if file already exists or was already downloaded in this session
-            if os.path.exists(filepath) or download_id in self.downloaded_files:
+            download_id = self._download_id(card)
+
+            # Skip if already downloaded (pure set lookup, the common case on
+            # a resumed run) or if the file already exists on disk; existing
+            # names come from one scandir per directory, not a stat per card
+            if download_id in self.downloaded_files or filename in self._existing_files(set_dir):
                 logger.debug(f"Skipping already downloaded: {filename}")
                 return True
             
             logger.info(f"Downloading: {filename} from {card['img_url']}")
-            
-            # Download the image with retries
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.session.get(card['img_url'], stream=True, timeout=30)
+
+            # Download the image; retries and backoff happen in urllib3's
+            # Retry mounted on the session. The body lands in a .part file
+            # that only reaches the real path via os.replace, so resumed
+            # runs and the skip caches never see a half-written image.
+            tmp_path = filepath + '.part'
+            try:
+                with self.session.get(card['img_url'], stream=True, timeout=30,
+                                      headers=_IMAGE_HEADERS) as response:
                     response.raise_for_status()
-                    
-                    # Save the image
-                    with open(filepath, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    
-                    # Verify the file was downloaded correctly
-                    if os.path.getsize(filepath) > 0:
-                        self.downloaded_files.add(download_id)
-                        self.save_progress()
-                        logger.info(f"Downloaded: {os.path.join('pokellector', self.language, card['set_code'], filename)}")
-                        return True
-                    else:
-                        os.remove(filepath)  # Remove empty file
-                        raise Exception("Downloaded file is empty")
-                        
-                except Exception as e:
-                    if attempt == max_retries - 1:  # Last attempt
-                        logger.error(f"Failed to download {card['img_url']} after {max_retries} attempts: {e}")
-                        if os.path.exists(filepath):
-                            os.remove(filepath)
-                        return False
-                    
-                    # Wait before retrying
-                    time.sleep(2 ** attempt)  # Exponential backoff
-            
-            return False
-            
+                    expected = int(response.headers.get('Content-Length') or 0)
+
+                    # Copy the body to disk in 256 KiB reads at C speed
+                    # rather than looping over 8 KiB chunks in Python
+                    response.raw.decode_content = True
+                    with open(tmp_path, 'wb', buffering=1024 * 1024) as f:
+                        shutil.copyfileobj(response.raw, f, length=256 * 1024)
+                        bytes_written = f.tell()
+
+                # Verify the download without re-statting the file: non-empty,
+                # and matching Content-Length when the server declared one
+                # (decode_content means a mismatch only flags short reads on
+                # identity responses, which is the usual case for images)
+                if bytes_written > 0 and (not expected or bytes_written == expected
+                                          or response.headers.get('Content-Encoding')):
+                    os.replace(tmp_path, filepath)
+                    self._existing_files(set_dir).add(filename)
+                    self._mark_downloaded(download_id)
+                    self._append_to_zip(filepath)
+                    logger.info(f"Downloaded: {os.path.join('pokellector', self.language, card['set_code'], filename)}")
+                    return True
+                raise Exception(
+                    f"Downloaded file is empty or truncated "
+                    f"({bytes_written}/{expected} bytes)"
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to download {card['img_url']}: {e}")
+                # Discard the partial temp file; missing is the common case
+                # when the GET itself failed
+                try:
+                    os.remove(tmp_path)
+                except FileNotFoundError:
+                    pass
+                return False
+
         except Exception as e:
             logger.error(f"Error downloading {card.get('name', 'unknown')} ({card.get('img_url', 'no url')}): {e}")
             return False
 
-    def create_zip_archive(self) -> str:
-        """Create a zip archive of the downloaded images."""
-        zip_path = os.path.join(os.path.dirname(self.output_dir), 'pokemon_cards.zip')
-        
+    def _zip_archive_path(self) -> str:
+        return os.path.join(os.path.dirname(self.output_dir), 'pokemon_cards.zip')
+
+    def _append_to_zip(self, filepath: str):
+        """Add a freshly written image to the archive while it's still warm.
+
+        Appending here overlaps archiving with downloading and leaves a
+        usable zip behind even if the run is interrupted; create_zip_archive
+        then only tops up files from earlier runs instead of re-reading
+        everything.
+        """
+        import zipfile
+
+        arcname = os.path.relpath(filepath, self.output_dir)
+        try:
+            with self._zip_lock:
+                if self._zip is None:
+                    self._zip = zipfile.ZipFile(self._zip_archive_path(), 'a',
+                                                zipfile.ZIP_STORED, allowZip64=True)
+                _zip_write(self._zip, filepath, arcname)
+        except Exception as e:
+            logger.error(f"Error appending {arcname} to zip archive: {e}")
+
+    def create_zip_archive(self, compress: bool = False) -> str:
+        """Finalize the zip archive of the downloaded images.
+
+        This run's downloads were already appended as they finished; here we
+        only add images from earlier runs that the archive doesn't carry yet
+        and close the handle. PNG/JPEG payloads are already
+        deflate-compressed internally, so top-ups default to ZIP_STORED —
+        pass compress=True to force single-pass DEFLATE at the lowest level.
+        """
+        import zipfile
+
+        zip_path = self._zip_archive_path()
+
         logger.info(f"Creating zip archive: {zip_path}")
-        
+
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Walk through the directory and add files to the zip
-                for root, _, files in os.walk(self.output_dir):
-                    for file in files:
-                        if not file.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-                            continue
-                            
-                        file_path = os.path.join(root, file)
-                        arcname = os.path.relpath(file_path, self.output_dir)
-                        zipf.write(file_path, arcname)
-            
+            with self._zip_lock:
+                if self._zip is None:
+                    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+                    if compress and _isal_zlib is not None:
+                        # zipfile builds its compressors off its module-global
+                        # zlib; swap in the ISA-L drop-in for faster DEFLATE
+                        zipfile.zlib = _isal_zlib
+                    self._zip = zipfile.ZipFile(zip_path, 'a', compression,
+                                                allowZip64=True, compresslevel=1)
+                # Top up anything not appended during this run (earlier runs,
+                # or downloads that raced the archive open)
+                existing = set(self._zip.namelist())
+                for file_path in _iter_images(self.output_dir):
+                    arcname = os.path.relpath(file_path, self.output_dir)
+                    if arcname.replace(os.sep, '/') not in existing:
+                        _zip_write(self._zip, file_path, arcname)
+                self._zip.close()
+                self._zip = None
+
             logger.info(f"Successfully created zip archive: {zip_path} ({os.path.getsize(zip_path) / (1024*1024):.2f} MB)")
             return zip_path
-            
+
         except Exception as e:
             logger.error(f"Error creating zip archive: {e}")
             return ""
 
+    def recompress_pngs(self, max_workers: Optional[int] = None) -> int:
+        """Recompress PNGs, then drop the incremental archive if any changed.
+
+        Entries appended while downloads ran hold the pre-optimization
+        bytes, so a successful recompression invalidates them; deleting
+        the archive makes create_zip_archive rebuild it from the
+        now-smaller files.
+        """
+        count = super().recompress_pngs(max_workers)
+        if count:
+            with self._zip_lock:
+                if self._zip is not None:
+                    self._zip.close()
+                    self._zip = None
+                try:
+                    os.remove(self._zip_archive_path())
+                except FileNotFoundError:
+                    pass
+        return count
+
+def _extract_card_details(soup, card_url: str, set_info: Dict[str, str],
+                          base_url: str) -> Optional[Dict[str, str]]:
+    """
+    Extract card details from a parsed card detail page.
+
+    Module-level (with base_url passed explicitly) so it can run inside
+    process-pool workers as well as on the scraper instance.
+    """
+    try:
+        logger.debug(f"Extracting card details from: {card_url}")
+        
+        # First, try to extract card number from the URL
+        # Example: https://www.pokellector.com/Journey-Together-Expansion/Meowscarada-ex-Card-18
+        card_number = None
+        url_parts = _url_tail(card_url)
+        
+        # Debug: Log URL parts for analysis
+        logger.debug(f"URL parts: {url_parts}")
+        
+        # Try to extract number from the last part of the URL (e.g., "Meowscarada-ex-Card-18" -> "18")
+        last_part = url_parts[-1]
+        logger.debug(f"Last part of URL: {last_part}")
+        
+        # Try the precompiled patterns to extract the card number; each is an
+        # alternation, so take whichever group captured
+        for pattern in _CARD_NUM_PATTERNS:
+            match = pattern.search(last_part)
+            if match:
+                card_number = next(g for g in match.groups() if g)
+                logger.debug(f"Extracted card number '{card_number}' using pattern: {pattern.pattern}")
+                break
+        
+        # If not found in URL, try to find it in the page content
+        if not card_number:
+            logger.debug("Card number not found in URL, checking page content")
+            # One compound selector over the real CSS hooks. The old list
+            # was dominated by :contains() pseudo-selectors, which
+            # BeautifulSoup does not support, so each one just raised and
+            # was swallowed by the try/except.
+            for elem in _SEL_CARD_NUMBER.select(soup):
+                # Look for patterns like "#123" or "123/200" or "No. 123"
+                match = _PAGE_NUM_RE.search(elem.get_text(strip=True))
+                if match:
+                    card_number = match.group(1)
+                    break
+
+                # Also check for numbers in data attributes
+                for attr in ['data-number', 'data-card-number', 'data-num']:
+                    if attr in elem.attrs:
+                        match = _DIGITS_RE.search(elem[attr])
+                        if match:
+                            card_number = match.group(1)
+                            break
+
+                if card_number:
+                    break
+
+            # Textual labels like "Card Number: 123" need a text scan,
+            # done in a single pass instead of per-tag pseudo-selectors
+            if not card_number:
+                label = soup.find(string=_NUM_LABEL_RE)
+                if label and label.parent:
+                    match = _PAGE_NUM_RE.search(label.parent.get_text(' ', strip=True))
+                    if match:
+                        card_number = match.group(1)
+
+            if card_number:
+                logger.debug(f"Found card number '{card_number}' in page content")
+        
+        if not card_number:
+            logger.warning(f"Couldn't determine card number for: {card_url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Page title: {soup.title.string if soup.title else 'No title'}")
+                # Dump the first 1000 characters of the page for debugging
+                # (str(soup) serializes the whole tree, so only pay on DEBUG)
+                logger.debug(f"Page content (first 1000 chars):\n{str(soup)[:1000]}")
+            return None
+        
+        # Clean up the card number (remove leading zeros, etc.)
+        card_number = str(int(card_number))  # Converts "001" to "1"
+
+        # Fast path: pokellector URLs shaped like ".../Meowscarada-ex-Card-18"
+        # carry the name too, so the selector scans below can be skipped
+        card_name = None
+        if '-Card-' in last_part:
+            name_part = last_part.split('-Card-')[0]
+            if name_part:
+                card_name = name_part.replace('-', ' ').title()
+
+        if not card_name:
+            # Get card name - one compound selector, single tree walk
+            for name_elem in _SEL_CARD_NAME.select(soup):
+                card_name = name_elem.get_text(strip=True)
+                # Clean up the name (remove set name, card number, etc.)
+                card_name = _NAME_BRACKETS_RE.sub('', card_name)  # Remove anything in brackets
+                card_name = _NAME_TRAIL_NUM_RE.sub('', card_name)  # Remove card number at the end
+                card_name = card_name.strip()
+                if card_name:
+                    break
+
+            if not card_name:
+                card_name = f"Card-{card_number}"
+
+        # Get image URL - keep scanning candidates until one resolves to an
+        # actual image file; the loose fallback selector only walks the tree
+        # when the class-based one found nothing at all
+        img_url = None
+        for sel in (_SEL_CARD_IMG, _SEL_CARD_IMG_FALLBACK):
+            for img in sel.select(soup):
+                img_url = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
+                if img_url and not img_url.startswith(('http://', 'https://')):
+                    img_url = _absolute_url(base_url, img_url)
+                if img_url and img_url.endswith(('.jpg', '.jpeg', '.png', '.webp')):
+                    break
+            if img_url:
+                break
+        
+        if not img_url:
+            logger.warning(f"No image found on card page: {card_url}")
+            return None
+        
+        # Clean up the image URL (remove query parameters, etc.)
+        img_url = img_url.split('?')[0]
+
+        return {
+            'name': card_name,
+            'number': card_number.zfill(3),  # Pad with leading zeros
+            'img_url': img_url,
+            'card_url': card_url,
+            'set_code': set_info['code'],
+            'set_name': set_info['name']
+        }
+        
+    except Exception as e:
+        logger.error(f"Error extracting details from card page {card_url}: {e}")
+        return None
+
+
+def _parse_card_page(raw: bytes, card_url: str, set_info: Dict[str, str],
+                     base_url: str) -> Optional[Dict[str, str]]:
+    """Parse raw card-page HTML and extract its card details.
+
+    Takes only picklable arguments so ProcessPoolExecutor workers can run it.
+    """
+    soup = BeautifulSoup(raw, HTML_PARSER)
+    return _extract_card_details(soup, card_url, set_info, base_url)
+
+
+# Emoji -> text substitution for Windows consoles, done in one compiled-regex
+# pass instead of four chained str.replace scans per log record ('⚠️' is two
+# codepoints, so a translate table alone can't cover it)
+_EMOJI_MAP = {'✅': '[OK]', '⚠️': '[!]', '❌': '[X]', '🎉': '[!]'}
+_EMOJI_RE = re.compile('|'.join(map(re.escape, _EMOJI_MAP)))
+
+
 class UnicodeStreamHandler(logging.StreamHandler):
     """Stream handler that properly handles Unicode characters on Windows."""
     def emit(self, record):
         try:
             msg = self.format(record)
             # Replace emojis with text equivalents for Windows console
-            msg = (msg.replace('✅', '[OK]')
-                     .replace('⚠️', '[!]')
-                     .replace('❌', '[X]')
-                     .replace('🎉', '[!]'))
-            stream = self.stream
-            stream.write(msg + self.terminator)
+            msg = _EMOJI_RE.sub(lambda m: _EMOJI_MAP[m.group()], msg)
+            self.stream.write(msg + self.terminator)
             self.flush()
         except Exception:
             self.handleError(record)
 
 def main():
+    parser = argparse.ArgumentParser(description='Pokémon card image scraper')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Number of parallel image downloads (default: 8)')
+    parser.add_argument('--compress', action='store_true',
+                        help='DEFLATE the zip archive instead of storing the '
+                             'already-compressed images as-is')
+    parser.add_argument('--optimize', action='store_true',
+                        help='Losslessly recompress downloaded PNGs with ect '
+                             'or zopflipng before archiving (slow, CPU-bound)')
+    args = parser.parse_args()
+
     try:
         # Configure logging
         logging.basicConfig(
@@ -840,6 +1582,10 @@ def main():
         # Set output directory
         scraper.output_dir = user_selection['output_dir']
         os.makedirs(scraper.output_dir, exist_ok=True)
+
+        # One walk of the output tree so resumed runs answer skip checks
+        # from memory instead of a stat per card
+        scraper._populate_existing()
         
         # Get all sets
         logger.info("Fetching available sets...")
@@ -869,21 +1615,37 @@ def main():
             except ValueError:
                 print("Invalid input. Please enter numbers separated by commas or 'all'.")
         
-        # Download selected sets
+        # Download selected sets; tqdm is only needed from here on
+        from tqdm import tqdm
+
         selected_sets = [sets[i] for i in selected_indices]
         logger.info(f"Starting download of {len(selected_sets)} sets...")
         
         total_cards = 0
         successful_downloads = 0
-        
-        for set_info in selected_sets:
+
+        # One download pool for the whole run; its threads (and the session
+        # connections they hold) are reused across sets instead of being
+        # torn down and respawned at every set boundary
+        download_pool = ThreadPoolExecutor(max_workers=args.workers)
+
+        # Discovery for the next set runs while the current set's images
+        # download, so the pipeline never sits idle between sets
+        discovery_pool = ThreadPoolExecutor(max_workers=1)
+        pending_cards = discovery_pool.submit(scraper.get_cards_from_set, selected_sets[0])
+
+        for i, set_info in enumerate(selected_sets):
+            current_cards = pending_cards
+            if i + 1 < len(selected_sets):
+                pending_cards = discovery_pool.submit(
+                    scraper.get_cards_from_set, selected_sets[i + 1])
             try:
                 print(f"\n{'='*50}")
                 print(f"Processing set: {set_info['name']} ({set_info['code']})")
                 print(f"URL: {set_info['url']}")
-                
-                # Get cards for this set
-                cards = scraper.get_cards_from_set(set_info)
+
+                # Get cards for this set (discovery may already be done)
+                cards = current_cards.result()
                 if not cards:
                     logger.warning(f"No cards found in set: {set_info['name']}")
                     continue
@@ -891,12 +1653,25 @@ def main():
                 total_cards += len(cards)
                 logger.info(f"Found {len(cards)} cards. Starting download...")
                 
-                # Download cards with progress bar
-                success_count = 0
-                with tqdm(cards, desc=f"Downloading {set_info['code']}", unit="card") as pbar:
-                    for card in pbar:
+                # Drop cards the progress log already covers before they pay
+                # thread dispatch; on a resumed run this collapses most of
+                # the set to main-thread set lookups
+                pending = [card for card in cards
+                           if scraper._download_id(card) not in scraper.downloaded_files]
+                already = len(cards) - len(pending)
+
+                # Download cards in parallel with a progress bar; image
+                # fetches are independent I/O so threads stack up cleanly
+                success_count = already
+                successful_downloads += already
+                with tqdm(total=len(cards), initial=already,
+                          desc=f"Downloading {set_info['code']}", unit="card") as pbar:
+                    futures = {download_pool.submit(scraper.download_image, card): card
+                               for card in pending}
+                    for future in as_completed(futures):
+                        card = futures[future]
                         try:
-                            if scraper.download_image(card):
+                            if future.result():
                                 success_count += 1
                                 successful_downloads += 1
                                 pbar.set_postfix(success=f"{success_count}/{len(cards)}")
@@ -904,17 +1679,23 @@ def main():
                                 logger.warning(f"Failed to download: {card.get('name', 'Unknown card')}")
                         except Exception as e:
                             logger.error(f"Error downloading card: {e}", exc_info=True)
+                        pbar.update(1)
                 
                 logger.info(f"[OK] Successfully downloaded {success_count}/{len(cards)} cards from {set_info['name']}")
-                time.sleep(1)  # Be nice to the server
-                
+
+                # Compact progress at the set boundary
+                if hasattr(scraper, 'save_progress'):
+                    scraper.save_progress()
+
             except Exception as e:
                 logger.error(f"Error processing set {set_info['name']}: {e}", exc_info=True)
                 continue
         
         # Create zip archive
         if successful_downloads > 0:
-            zip_path = scraper.create_zip_archive()
+            if args.optimize:
+                scraper.recompress_pngs()
+            zip_path = scraper.create_zip_archive(compress=args.compress)
             if zip_path:
                 logger.info(f"\n[!] Scraping completed successfully!")
                 logger.info(f"Total cards processed: {successful_downloads}")
@@ -928,6 +1709,10 @@ def main():
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}", exc_info=True)
     finally:
+        if 'discovery_pool' in locals():
+            discovery_pool.shutdown(wait=True)
+        if 'download_pool' in locals():
+            download_pool.shutdown(wait=True)
         # Save progress if scraper was initialized
         if 'scraper' in locals() and hasattr(scraper, 'save_progress'):
             scraper.save_progress()
@@ -939,39 +1724,31 @@ class TCGCollectorScraper(BaseScraper):
         self.language = language
         base_url = "https://www.tcgcollector.com"
         super().__init__(base_url)
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
+        # Browser headers set once on the pooled session instead of being
+        # rebuilt and passed on every get_soup call
+        self.session.headers.update(BROWSER_HEADERS)
     
     def get_sets(self) -> List[Dict[str, str]]:
         """Get all Pokémon card sets from TCG Collector."""
         url = f"{self.base_url}/sets/intl" if self.language != 'en' else f"{self.base_url}/sets"
         logger.info(f"Fetching sets from: {url}")
         
-        # Add headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Referer': 'https://www.tcgcollector.com/',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-        
-        soup = self.get_soup(url, headers=headers)
+        # The set links are self-contained anchors, so parse only those
+        soup = self.get_soup(url, headers={'Referer': f'{self.base_url}/'},
+                             strainer=SoupStrainer('a', class_='set-logo-grid-item-set-name'))
         if not soup:
             logger.error("Failed to fetch sets page")
             return []
             
         logger.debug(f"Page title: {soup.title.string if soup.title else 'No title'}")
-        
-        # Debug: Save the HTML for inspection
-        with open('tcgcollector_sets.html', 'w', encoding='utf-8') as f:
-            f.write(str(soup))
-            
+
+        # Debug: Save the HTML for inspection. str(soup) re-serializes the
+        # whole DOM, so only pay for it when DEBUG logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            with open('tcgcollector_sets.html', 'w', encoding='utf-8') as f:
+                f.write(str(soup))
+
+
         sets = []
         # Look for set links in the grid
         set_links = soup.select('a.set-logo-grid-item-set-name')
@@ -983,7 +1760,7 @@ class TCGCollectorScraper(BaseScraper):
                 if not set_name:
                     set_name = link.get_text(strip=True)
                     
-                set_url = urljoin(self.base_url, link['href'])
+                set_url = self._abs(link['href'])
                 set_code = self._extract_set_code(set_url)
                 
                 if not all([set_name, set_url, set_code]):
@@ -1010,128 +1787,173 @@ class TCGCollectorScraper(BaseScraper):
     def _extract_set_code(self, url: str) -> str:
         """Extract set code from URL."""
         # Example: /sets/11645/journey-together -> journey-together
-        parts = url.rstrip('/').split('/')
+        parts = _url_tail(url)
         if len(parts) >= 2:
             return parts[-1]
         return ""
     
     def get_cards_from_set(self, set_info: Dict[str, str]) -> List[Dict[str, str]]:
-        """Get all cards from a specific set."""
+        """Get all cards from a specific set.
+
+        Page 1 is fetched alone; if its pagination links reveal the total
+        page count, the remaining pages are fetched in parallel through the
+        session's connection pool instead of one-per-second sequentially.
+        """
         logger.info(f"Fetching cards for set: {set_info['name']} ({set_info['code']})")
         logger.debug(f"Set URL: {set_info['url']}")
-        
+
         cards = []
-        page = 1
+        seen_urls: Set[str] = set()  # O(1) dedup across (possibly overlapping) pages
         max_pages = 50  # Safety limit to prevent infinite loops
-        
-        while page <= max_pages:
-            logger.debug(f"Fetching page {page} of cards...")
-            
-            # Add parameters for pagination and display
-            params = {
-                'releaseDateOrder': 'newToOld',
-                'displayAs': 'images',
-                'page': page,
-                'pageSize': 100  # Try to get more cards per page if possible
-            }
-            
-            url = f"{set_info['url']}?{urlencode(params)}"
-            logger.debug(f"Fetching URL: {url}")
-            
-            # Add headers to mimic a real browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Referer': set_info['url'],
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            soup = self.get_soup(url, headers=headers)
-            if not soup:
-                logger.error(f"Failed to fetch page {page}")
-                break
-                
-            # Debug: Save the HTML for inspection
+
+        soup = self._fetch_card_page(set_info, 1)
+        if not soup:
+            logger.error("Failed to fetch page 1")
+            return cards
+        cards.extend(self._parse_card_grid(soup, set_info, 1, seen_urls))
+        if not cards:
+            logger.warning("No card containers found, page might be empty or using different structure")
+            return cards
+
+        last_page = min(self._last_page_number(soup), max_pages)
+        if last_page > 1:
+            # Total known up front: dispatch the rest concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                page_soups = executor.map(
+                    lambda p: self._fetch_card_page(set_info, p),
+                    range(2, last_page + 1))
+                for page, page_soup in enumerate(page_soups, start=2):
+                    if not page_soup:
+                        logger.error(f"Failed to fetch page {page}")
+                        continue
+                    cards.extend(self._parse_card_grid(page_soup, set_info, page, seen_urls))
+        else:
+            # Total unknown: walk next links sequentially as before
+            page = 1
+            while page < max_pages and soup.select_one(
+                    'a.page-link[rel="next"], a.next-page, a[rel="next"]'):
+                page += 1
+                soup = self._fetch_card_page(set_info, page)
+                if not soup:
+                    logger.error(f"Failed to fetch page {page}")
+                    break
+                found = self._parse_card_grid(soup, set_info, page, seen_urls)
+                if not found:
+                    break
+                cards.extend(found)
+
+        logger.info(f"Found {len(cards)} cards in set {set_info['name']}")
+        return cards
+
+    # Pagination/display parameters; everything but the page number is
+    # static, so encode it once instead of per fetched page
+    _PAGE_QUERY = urlencode({
+        'releaseDateOrder': 'newToOld',
+        'displayAs': 'images',
+        'pageSize': 100  # Try to get more cards per page if possible
+    })
+
+    def _fetch_card_page(self, set_info: Dict[str, str], page: int) -> Optional[BeautifulSoup]:
+        """Fetch and parse one card-grid page of a set."""
+        logger.debug(f"Fetching page {page} of cards...")
+
+        url = f"{set_info['url']}?{self._PAGE_QUERY}&page={page}"
+        logger.debug(f"Fetching URL: {url}")
+
+        # Only the Referer varies per request; the browser headers live
+        # on the session
+        soup = self.get_soup(url, headers={'Referer': set_info['url']})
+
+        # Debug: Save the HTML for inspection (DEBUG runs only — the
+        # reserialization is as big as the page itself)
+        if soup and logger.isEnabledFor(logging.DEBUG):
             with open(f'tcgcollector_page_{page}.html', 'w', encoding='utf-8') as f:
                 f.write(str(soup))
-            
-            # Find all card containers - update selector based on actual page structure
-            card_containers = soup.select('.card-image-grid-item, .card-item')
-            logger.debug(f"Found {len(card_containers)} card containers on page {page}")
-            
-            if not card_containers:
-                logger.warning("No card containers found, page might be empty or using different structure")
-                break
-                
-            for container in card_containers:
-                try:
-                    # Try to find the image element
-                    img = container.select_one('img')
-                    if not img or not img.get('src') and not img.get('data-src'):
-                        logger.debug("Skipping container with no valid image")
-                        continue
-                        
-                    # Get image URL (prefer data-src for lazy-loaded images)
-                    img_url = img.get('data-src') or img.get('src')
-                    if not img_url:
-                        logger.debug("No image URL found")
-                        continue
-                        
-                    # Clean up the image URL
-                    img_url = img_url.split('?')[0]  # Remove query parameters
-                    img_url = urljoin(self.base_url, img_url)
-                    
-                    # Get card name from alt text or other elements
-                    card_name = img.get('alt', '').strip()
-                    if not card_name:
-                        name_elem = container.select_one('.card-name, .name')
-                        if name_elem:
-                            card_name = name_elem.get_text(strip=True)
-                    
-                    # Extract card number
-                    card_number = ''
-                    number_elem = container.select_one('.card-number, .number')
-                    if number_elem:
-                        card_number = number_elem.get_text(strip=True).strip('#')
-                    
-                    # Get card URL
-                    card_url = ''
-                    link = container.find_parent('a')
-                    if link and link.get('href'):
-                        card_url = urljoin(self.base_url, link['href'])
-                    
-                    if not card_name:
-                        logger.warning(f"Skipping card with no name at {img_url}")
-                        continue
-                        
-                    # Create card data
-                    card_data = {
-                        'name': card_name,
-                        'number': card_number or '0',
-                        'set_code': set_info['code'],
-                        'image_url': img_url,
-                        'card_url': card_url or set_info['url'],
-                        'language': self.language,
-                        'source': 'tcgcollector'
-                    }
+
+        return soup
+
+    def _last_page_number(self, soup) -> int:
+        """Largest page= value among pagination links, or 1 if none."""
+        last = 1
+        for link in soup.select('.pagination a[href], a.page-link[href]'):
+            query = parse_qs(urlparse(link['href']).query)
+            try:
+                last = max(last, int(query.get('page', ['1'])[0]))
+            except ValueError:
+                continue
+        return last
+
+    def _parse_card_grid(self, soup, set_info: Dict[str, str], page: int,
+                         seen_urls: Set[str]) -> List[Dict[str, str]]:
+        """Extract cards from one parsed card-grid page."""
+        cards = []
+
+        # Find all card containers - update selector based on actual page structure
+        card_containers = soup.select('.card-image-grid-item, .card-item')
+        logger.debug(f"Found {len(card_containers)} card containers on page {page}")
+
+        for container in card_containers:
+            try:
+                # Try to find the image element
+                img = container.select_one('img')
+                if not img or not img.get('src') and not img.get('data-src'):
+                    logger.debug("Skipping container with no valid image")
+                    continue
                     
-                    logger.debug(f"Found card: {card_name} ({card_number})")
-                    cards.append(card_data)
+                # Get image URL (prefer data-src for lazy-loaded images)
+                img_url = img.get('data-src') or img.get('src')
+                if not img_url:
+                    logger.debug("No image URL found")
+                    continue
                     
-                except Exception as e:
-                    logger.error(f"Error parsing card: {e}", exc_info=True)
+                # Clean up the image URL
+                img_url = img_url.split('?')[0]  # Remove query parameters
+                img_url = self._abs(img_url)
+                if img_url in seen_urls:
                     continue
-            
-            # Check if there's a next page
-            next_page = soup.select_one('a.page-link[rel="next"], a.next-page, a[rel="next"]')
-            if not next_page:
-                logger.debug("No more pages found")
-                break
+                seen_urls.add(img_url)
+
+                # Get card name from alt text or other elements
+                card_name = img.get('alt', '').strip()
+                if not card_name:
+                    name_elem = container.select_one('.card-name, .name')
+                    if name_elem:
+                        card_name = name_elem.get_text(strip=True)
                 
-            page += 1
-            time.sleep(1)  # Be nice to the server
-            
-        logger.info(f"Found {len(cards)} cards in set {set_info['name']}")
+                # Extract card number
+                card_number = ''
+                number_elem = container.select_one('.card-number, .number')
+                if number_elem:
+                    card_number = number_elem.get_text(strip=True).strip('#')
+                
+                # Get card URL
+                card_url = ''
+                link = container.find_parent('a')
+                if link and link.get('href'):
+                    card_url = self._abs(link['href'])
+                
+                if not card_name:
+                    logger.warning(f"Skipping card with no name at {img_url}")
+                    continue
+                    
+                # Create card data
+                card_data = {
+                    'name': card_name,
+                    'number': card_number or '0',
+                    'set_code': set_info['code'],
+                    'image_url': img_url,
+                    'card_url': card_url or set_info['url'],
+                    'language': self.language,
+                    'source': 'tcgcollector'
+                }
+                
+                logger.debug(f"Found card: {card_name} ({card_number})")
+                cards.append(card_data)
+                
+            except Exception as e:
+                logger.error(f"Error parsing card: {e}", exc_info=True)
+                continue
+
         return cards
     
     def download_image(self, card: Dict[str, str]) -> bool:
@@ -1148,40 +1970,71 @@ class TCGCollectorScraper(BaseScraper):
                 self.language,    # Language
                 card['set_code']  # Set code
             )
-            os.makedirs(set_dir, exist_ok=True)
+            self._ensure_dir(set_dir)
             
             # Generate a safe filename
-            safe_name = re.sub(r'[^\w\s-]', '', card['name']).strip()
-            safe_name = re.sub(r'\s+', '-', safe_name)  # Replace spaces with hyphens
+            safe_name = _safe_filename(card['name'])
             
-            # Format the card number with leading zeros
-            try:
-                card_number = str(int(card['number']))
-                card_number = card_number.zfill(3)  # Pad with leading zeros
-            except (ValueError, TypeError):
-                card_number = card.get('number', '000')
+            # Format the card number with leading zeros; plain digit strings
+            # (the usual case) pad directly without a str(int(...)) round-trip
+            n = card.get('number') or '000'
+            card_number = n.zfill(3) if n.isdigit() else n
             
             # Create filename: set_code-number-name.jpg
             filename = f"{card['set_code']}-{card_number}-{safe_name}.jpg"
             filepath = os.path.join(set_dir, filename)
             
-            # Skip if already downloaded and has content
-            if os.path.exists(filepath):
-                file_size = os.path.getsize(filepath)
-                if file_size > 1024:  # File exists and has reasonable size
-                    logger.debug(f"Skipping existing: {filename} ({file_size} bytes)")
+            # Skip if already downloaded and has content; one stat answers
+            # the existence, size and modification-time questions
+            try:
+                st = os.stat(filepath)
+                file_size, file_mtime = st.st_size, st.st_mtime
+            except OSError:
+                file_size, file_mtime = 0, 0.0
+            if file_size > 1024:  # File exists and has reasonable size
+                logger.debug(f"Skipping existing: {filename} ({file_size} bytes)")
+                return True
+
+            # A suspiciously small file gets revalidated with a conditional
+            # GET: a 304 confirms it unchanged without transferring the body
+            headers = dict(_IMAGE_HEADERS)
+            if file_size:
+                from email.utils import formatdate
+                headers['If-Modified-Since'] = formatdate(file_mtime, usegmt=True)
+
+            # Download the image, copying the body to disk in 256 KiB reads
+            # at C speed rather than looping over 8 KiB chunks in Python
+            with self.session.get(card['image_url'], stream=True, timeout=30,
+                                  headers=headers) as response:
+                if response.status_code == 304:
+                    logger.debug(f"304 Not Modified, keeping existing: {filename}")
                     return True
-                logger.warning(f"Found existing file with size {file_size} bytes, re-downloading: {filename}")
-                
-            # Download the image
-            response = self.session.get(card['image_url'], stream=True, timeout=30)
-            response.raise_for_status()
-            
-            # Save the image
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    
+                response.raise_for_status()
+                # A suspiciously small existing file may still be complete
+                # (tiny icon-sized images exist); trust it if it matches the
+                # server's Content-Length rather than re-downloading the body
+                if file_size:
+                    expected = int(response.headers.get('Content-Length') or 0)
+                    if expected and expected == file_size:
+                        response.close()
+                        logger.debug(f"Existing file matches Content-Length, keeping: {filename}")
+                        return True
+                    logger.warning(f"Found existing file with size {file_size} bytes, re-downloading: {filename}")
+                # Stream into a .part file and move it into place atomically
+                # so a failed transfer never leaves a partial image behind
+                tmp_path = filepath + '.part'
+                try:
+                    response.raw.decode_content = True
+                    with open(tmp_path, 'wb', buffering=1024 * 1024) as f:
+                        shutil.copyfileobj(response.raw, f, length=256 * 1024)
+                    os.replace(tmp_path, filepath)
+                except Exception:
+                    try:
+                        os.remove(tmp_path)
+                    except FileNotFoundError:
+                        pass
+                    raise
+
             logger.info(f"Downloaded: {os.path.join('tcgcollector', self.language, card['set_code'], filename)}")
             return True
             
@@ -1189,33 +2042,39 @@ class TCGCollectorScraper(BaseScraper):
             logger.error(f"Error downloading {card.get('name', 'unknown')}: {e}")
             return False
             
-    def create_zip_archive(self) -> str:
-        """Create a zip archive of all downloaded images."""
+    def create_zip_archive(self, compress: bool = False) -> str:
+        """Create a zip archive of all downloaded images.
+
+        Defaults to ZIP_STORED since the images are already compressed;
+        compress=True forces low-level DEFLATE.
+        """
+        import zipfile
+        from datetime import datetime
+
         try:
             # Create a zip file with timestamp
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             zip_filename = f"pokemon_cards_tcgcollector_{self.language}_{timestamp}.zip"
             zip_path = os.path.join(self.output_dir, zip_filename)
             
-            # Get all image files
-            image_extensions = ('.jpg', '.jpeg', '.png', '.webp')
-            image_files = []
-            
-            for root, _, files in os.walk(self.output_dir):
-                for file in files:
-                    if file.lower().endswith(image_extensions):
-                        image_files.append(os.path.join(root, file))
-            
+            # Get all image files with DirEntry-cached stats
+            image_files = list(_iter_images(self.output_dir))
+
             if not image_files:
                 logger.warning("No image files found to include in the zip archive.")
                 return ""
                 
             # Create zip file
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            if compress and _isal_zlib is not None:
+                # Same ISA-L swap as the pokellector archive path
+                zipfile.zlib = _isal_zlib
+            with zipfile.ZipFile(zip_path, 'w', compression,
+                                 allowZip64=True, compresslevel=1) as zipf:
                 for image_file in image_files:
                     # Calculate the relative path for the zip file
                     rel_path = os.path.relpath(image_file, self.output_dir)
-                    zipf.write(image_file, rel_path)
+                    _zip_write(zipf, image_file, rel_path)
             
             logger.info(f"Created zip archive: {zip_path} ({os.path.getsize(zip_path) / (1024*1024):.2f} MB)")
             return zip_path